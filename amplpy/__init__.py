@@ -15,4 +15,5 @@ from .dataframe import DataFrame
 from .utils import multidict, register_magics
 from .environment import Environment
 from .ampl import AMPL
+from .parallel import solve_batch, solve_batch_async
 __version__ = '0.6.11'
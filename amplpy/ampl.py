@@ -3,7 +3,11 @@ from __future__ import print_function, absolute_import, division
 from builtins import map, range, object, zip, sorted
 from past.builtins import basestring
 
-from threading import Thread, Lock
+from numbers import Real
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from traceback import print_exception
 from .errorhandler import ErrorHandler
 from .outputhandler import OutputHandler
 from .objective import Objective
@@ -17,11 +21,19 @@ from .exceptions import AMPLException
 from .entity import Entity
 from .utils import Utils
 from . import amplpython
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+from sys import modules
 inf = float('inf')
+_NUMERIC_START = frozenset('0123456789.')
+_SPECIAL_VALUES = frozenset(('inf', 'infinity', 'nan'))
+
+
+def _printException(future):
+    exception = future.exception()
+    if exception is not None:
+        print_exception(
+            type(exception), exception,
+            getattr(exception, '__traceback__', None)
+        )
 
 
 class AMPL(object):
@@ -66,6 +78,22 @@ class AMPL(object):
     :func:`~amplpy.AMPL.setOutputHandler`.
     """
 
+    __slots__ = (
+        '_impl',
+        '_errorhandler',
+        '_errorhandler_inner',
+        '_errorhandler_wrapper',
+        '_outputhandler',
+        '_outputhandler_internal',
+        '_lock',
+        '_langext',
+        '_batch',
+        '_option_cache',
+        '_entity_cache',
+        '_executor',
+        '__weakref__',
+    )
+
     def __init__(self, environment=None, langext=None):
         """
         Constructor:
@@ -104,6 +132,10 @@ class AMPL(object):
         self._outputhandler = None
         self._lock = Lock()
         self._langext = langext
+        self._batch = None
+        self._option_cache = {}
+        self._entity_cache = {}
+        self._executor = None
         self.setOutputHandler(OutputHandler())
         self.setErrorHandler(ErrorHandler())
 
@@ -145,11 +177,70 @@ class AMPL(object):
             DataFrame capturing the output of the display
             command in tabular form.
         """
+        self._flush()
         # FIXME: only works for the first statement.
         return DataFrame._fromDataFrameRef(
             self._impl.getData(list(statements), len(statements))
         )
 
+    def getDataArray(self, *statements):
+        """
+        Get the data corresponding to the display statements as numpy arrays.
+        This is a convenience wrapper around :func:`~amplpy.AMPL.getData`
+        that copies each column into an array: columns with only numeric
+        values become float arrays and any other column an object array.
+
+        Args:
+            statements: The display statements to be fetched.
+
+        Raises:
+            RuntimeError: if the AMPL visualization command does not succeed.
+
+        Returns:
+            Dictionary mapping the column headers to numpy arrays with the
+            corresponding values.
+        """
+        import numpy as np
+        df = self.getData(*statements)
+        arrays = {}
+        for header in df.getHeaders():
+            values = list(df.getColumn(header))
+            if all(isinstance(value, Real) for value in values):
+                arrays[header] = np.array(values, dtype=float)
+            else:
+                arrays[header] = np.array(values, dtype=object)
+        return arrays
+
+    def getVariableSnapshot(self):
+        """
+        Get the names, values and reduced costs of all the variable instances
+        in the current problem with a single call to the underlying AMPL
+        interpreter. It is based on the AMPL synthetic parameters
+        ``_varname`` and ``_var``:
+
+        .. code-block:: ampl
+
+            display _varname, _var, _var.rc;
+
+        Returns:
+            A tuple ``(names, values, reducedCosts)`` of lists with one
+            element per variable instance.
+
+        Raises:
+            RuntimeError: if the display command does not return the three
+            expected columns.
+        """
+        df = self.getData('_varname, _var, _var.rc')
+        headers = df.getHeaders()[df.getNumIndices():]
+        if len(headers) != 3:
+            raise RuntimeError(
+                'Expected 3 columns but got {}.'.format(len(headers))
+            )
+        names, values, reducedCosts = (
+            list(df.getColumn(header)) for header in headers
+        )
+        return names, values, reducedCosts
+
     def getEntity(self, name):
         """
         Get entity corresponding to the specified name (looks for it in all
@@ -164,6 +255,7 @@ class AMPL(object):
         Returns:
             The AMPL entity with the specified name.
         """
+        self._flush()
         return Entity(self._impl.getEntity(name))
 
     def getVariable(self, name):
@@ -176,7 +268,8 @@ class AMPL(object):
         Raises:
             TypeError: if the specified variable does not exist.
         """
-        return Variable(self._impl.getVariable(name))
+        self._flush()
+        return self._getCachedEntity(Variable, self._impl.getVariable, name)
 
     def getConstraint(self, name):
         """
@@ -188,7 +281,10 @@ class AMPL(object):
         Raises:
             TypeError: if the specified constraint does not exist.
         """
-        return Constraint(self._impl.getConstraint(name))
+        self._flush()
+        return self._getCachedEntity(
+            Constraint, self._impl.getConstraint, name
+        )
 
     def getObjective(self, name):
         """
@@ -200,7 +296,8 @@ class AMPL(object):
         Raises:
             TypeError: if the specified objective does not exist.
         """
-        return Objective(self._impl.getObjective(name))
+        self._flush()
+        return self._getCachedEntity(Objective, self._impl.getObjective, name)
 
     def getSet(self, name):
         """
@@ -212,7 +309,8 @@ class AMPL(object):
         Raises:
             TypeError: if the specified set does not exist.
         """
-        return Set(self._impl.getSet(name))
+        self._flush()
+        return self._getCachedEntity(Set, self._impl.getSet, name)
 
     def getParameter(self, name):
         """
@@ -224,7 +322,25 @@ class AMPL(object):
         Raises:
             TypeError: if the specified parameter does not exist.
         """
-        return Parameter(self._impl.getParameter(name))
+        self._flush()
+        return self._getCachedEntity(Parameter, self._impl.getParameter, name)
+
+    def _getCachedEntity(self, entityClass, getter, name):
+        cache = self._entity_cache
+        key = (entityClass, name)
+        entity = cache.get(key)
+        if entity is None:
+            entity = entityClass(getter(name))
+            cache[key] = entity
+        return entity
+
+    def _invalidate(self):
+        # The caches are replaced rather than cleared: callers keep the dict
+        # that was current before their native call, so a value fetched
+        # while an async operation invalidates the caches is stored in the
+        # discarded dict instead of the new one.
+        self._option_cache = {}
+        self._entity_cache = {}
 
     def eval(self, amplstatements, **kwargs):
         """
@@ -254,6 +370,75 @@ class AMPL(object):
         """
         if self._langext is not None:
             amplstatements = self._langext.translate(amplstatements, **kwargs)
+        self._eval(amplstatements)
+
+    def evalMany(self, statements, **kwargs):
+        """
+        Equivalent to calling :func:`~amplpy.AMPL.eval` for each statement in
+        the sequence, but the statements are passed to the interpreter in a
+        single call. A semicolon is appended, on a new line, to every
+        statement (the resulting empty statements are harmless).
+
+        Args:
+          statements: A sequence of AMPL statements and declarations to be
+          passed to the interpreter.
+
+        Raises:
+          RuntimeError: if the underlying interpreter is not running.
+        """
+        self.eval(
+            '\n'.join(statement + '\n;' for statement in statements),
+            **kwargs
+        )
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that buffers the statements passed to
+        :func:`~amplpy.AMPL.eval`, :func:`~amplpy.AMPL.evalMany`,
+        :func:`~amplpy.AMPL.setOption`, :func:`~amplpy.AMPL.setOptions` and
+        :func:`~amplpy.AMPL.reset` and sends them to the interpreter in a
+        single call. The buffer is sent when the block exits and before any
+        other method that uses the interpreter (e.g.,
+        :func:`~amplpy.AMPL.solve`, :func:`~amplpy.AMPL.readData` or
+        :func:`~amplpy.AMPL.getOption`) of this object, so those calls see
+        the effect of the buffered statements. Methods of entity objects
+        (e.g., :func:`~amplpy.Parameter.set`, :func:`~amplpy.Variable.value`
+        or :func:`~amplpy.Set.setValues`) do not send the buffer: they read
+        the state from before the buffered statements and run ahead of them.
+        If the block raises an exception, the statements still in the buffer
+        are discarded.
+
+        .. code-block:: python
+
+            with ampl.batch():
+                ampl.setOption('solver', 'gurobi')
+                ampl.eval('param n := 10;')
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = []
+        try:
+            yield self
+            statements = self._batch
+        finally:
+            self._batch = None
+        if statements:
+            self._eval('\n'.join(statements))
+
+    def _flush(self):
+        if self._batch:
+            statements, self._batch = self._batch, []
+            self._invalidate()
+            self._impl.eval('\n'.join(statements))
+            self._errorhandler_wrapper.check()
+
+    def _eval(self, amplstatements):
+        if self._batch is not None:
+            self._batch.append(amplstatements)
+            return
+        self._invalidate()
         self._impl.eval(amplstatements)
         self._errorhandler_wrapper.check()
 
@@ -269,6 +454,8 @@ class AMPL(object):
         Returns:
           A string with the output.
         """
+        self._flush()
+        self._invalidate()
         return self._impl.getOutput(amplstatements)
 
     def reset(self):
@@ -276,7 +463,11 @@ class AMPL(object):
         Clears all entities in the underlying AMPL interpreter, clears all maps
         and invalidates all entities.
         """
-        self._impl.reset()
+        if self._batch is not None:
+            self._batch.append('reset;')
+        else:
+            self._invalidate()
+            self._impl.reset()
 
     def close(self):
         """
@@ -288,6 +479,11 @@ class AMPL(object):
             self._impl.close()
         except AttributeError:
             pass
+        try:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+        except AttributeError:
+            pass
 
     def isRunning(self):
         """
@@ -313,6 +509,8 @@ class AMPL(object):
         Raises:
             RuntimeError: if the underlying interpreter is not running.
         """
+        self._flush()
+        self._option_cache = {}
         self._impl.solve()
 
     def readAsync(self, fileName, callback=None, **kwargs):
@@ -328,7 +526,15 @@ class AMPL(object):
 
             callback: Callback to be executed when the file has been
             interpreted.
+
+        Returns:
+            A :class:`concurrent.futures.Future` that completes when the
+            operation is over; it can be awaited in asyncio code with
+            :func:`asyncio.wrap_future`. Exceptions raised by the operation
+            are stored in the future and, if a callback is given, also
+            printed to stderr.
         """
+        self._flush()
         if self._langext is not None:
             with open(fileName, 'r') as fin:
                 newmodel = self._langext.translate(fin.read(), **kwargs)
@@ -339,7 +545,11 @@ class AMPL(object):
         def async_call():
             self._lock.acquire()
             try:
-                self._impl.read(fileName)
+                self._invalidate()
+                try:
+                    self._impl.read(fileName)
+                finally:
+                    self._invalidate()
                 self._errorhandler_wrapper.check()
             except Exception:
                 self._lock.release()
@@ -348,7 +558,7 @@ class AMPL(object):
                 self._lock.release()
                 if callback is not None:
                     callback.run()
-        Thread(target=async_call).start()
+        return self._submit(async_call, callback)
 
     def readDataAsync(self, fileName, callback=None):
         """
@@ -363,11 +573,23 @@ class AMPL(object):
 
             callback: Callback to be executed when the file has been
             interpreted.
+
+        Returns:
+            A :class:`concurrent.futures.Future` that completes when the
+            operation is over; it can be awaited in asyncio code with
+            :func:`asyncio.wrap_future`. Exceptions raised by the operation
+            are stored in the future and, if a callback is given, also
+            printed to stderr.
         """
+        self._flush()
         def async_call():
             self._lock.acquire()
             try:
-                self._impl.readData(fileName)
+                self._invalidate()
+                try:
+                    self._impl.readData(fileName)
+                finally:
+                    self._invalidate()
                 self._errorhandler_wrapper.check()
             except Exception:
                 self._lock.release()
@@ -376,7 +598,7 @@ class AMPL(object):
                 self._lock.release()
                 if callback is not None:
                     callback.run()
-        Thread(target=async_call).start()
+        return self._submit(async_call, callback)
 
     def evalAsync(self, amplstatements, callback=None, **kwargs):
         """
@@ -389,18 +611,29 @@ class AMPL(object):
           callback: Callback to be executed when the statement has been
           interpreted.
 
+        Returns:
+          A :class:`concurrent.futures.Future` that completes when the
+          statements have been interpreted. Exceptions raised by the
+          operation are stored in the future and, if a callback is given,
+          also printed to stderr.
+
         Raises:
           RuntimeError: if the input is not a complete AMPL statement (e.g.
           if it does not end with semicolon) or if the underlying
           interpreter is not running.
         """
+        self._flush()
         if self._langext is not None:
             amplstatements = self._langext.translate(amplstatements, **kwargs)
 
         def async_call():
             self._lock.acquire()
             try:
-                self._impl.eval(amplstatements)
+                self._invalidate()
+                try:
+                    self._impl.eval(amplstatements)
+                finally:
+                    self._invalidate()
                 self._errorhandler_wrapper.check()
             except Exception:
                 self._lock.release()
@@ -409,7 +642,7 @@ class AMPL(object):
                 self._lock.release()
                 if callback is not None:
                     callback.run()
-        Thread(target=async_call).start()
+        return self._submit(async_call, callback)
 
     def solveAsync(self, callback=None):
         """
@@ -417,11 +650,21 @@ class AMPL(object):
 
         Args:
           callback: Callback to be executed when the solver is done.
+
+        Returns:
+          A :class:`concurrent.futures.Future` that completes when the
+          solver is done. Exceptions raised by the operation are stored in
+          the future and, if a callback is given, also printed to stderr.
         """
+        self._flush()
         def async_call():
             self._lock.acquire()
             try:
-                self._impl.solve()
+                self._option_cache = {}
+                try:
+                    self._impl.solve()
+                finally:
+                    self._option_cache = {}
             except Exception:
                 self._lock.release()
                 raise
@@ -429,7 +672,17 @@ class AMPL(object):
                 self._lock.release()
                 if callback is not None:
                     callback.run()
-        Thread(target=async_call).start()
+        return self._submit(async_call, callback)
+
+    def _submit(self, async_call, callback):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        future = self._executor.submit(async_call)
+        if callback is not None:
+            # Callback-style callers may never look at the future, so keep
+            # errors visible as they were with plain threads.
+            future.add_done_callback(_printException)
+        return future
 
     def wait(self):
         """
@@ -459,6 +712,7 @@ class AMPL(object):
         Returns:
             Current working directory.
         """
+        self._flush()
         if path is None:
             return self._impl.cd()
         else:
@@ -478,14 +732,108 @@ class AMPL(object):
 
             TypeError: if the value has an invalid type.
         """
+        if self._batch is not None:
+            if not self._isMultilineOption(value):
+                self._batch.append(
+                    'option {} {};'.format(name, self._formatOption(value))
+                )
+                return
+            # AMPL string literals cannot span lines, so set it directly
+            self._flush()
+        setter = self._optionSetters.get(type(value))
+        if setter is None:
+            for cls, setter in self._optionSettersByClass:
+                if isinstance(value, cls):
+                    break
+            else:
+                raise TypeError
+        setter(self, name, value)
+
+    def _setBoolOption(self, name, value):
+        cache = self._option_cache
+        self._impl.setBoolOption(name, value)
+        cache[name] = int(value)
+
+    def _setIntOption(self, name, value):
+        cache = self._option_cache
+        self._impl.setIntOption(name, value)
+        cache[name] = value
+
+    def _setDblOption(self, name, value):
+        # AMPL may display a float option as an integer (e.g., 2.0 as 2),
+        # so the value is read back from the interpreter when requested
+        cache = self._option_cache
+        self._impl.setDblOption(name, value)
+        cache.pop(name, None)
+
+    def _setStrOption(self, name, value):
+        cache = self._option_cache
+        self._impl.setOption(name, value)
+        cache[name] = self._castOption(value)
+
+    _optionSettersByClass = (
+        (bool, _setBoolOption),
+        (int, _setIntOption),
+        (float, _setDblOption),
+        (basestring, _setStrOption),
+    )
+    _optionSetters = dict(_optionSettersByClass[:3])
+    _optionSetters[str] = _setStrOption
+
+    def setOptions(self, options):
+        """
+        Set multiple AMPL options with a single call to the interpreter.
+        String values spanning multiple lines cannot be written as AMPL
+        literals and are set individually with
+        :func:`~amplpy.AMPL.setOption`.
+
+        Args:
+            options: Dictionary mapping option names to the values they must
+            be set to.
+
+        Raises:
+            TypeError: if any of the values has an invalid type.
+        """
+        single, multiline = {}, {}
+        for name, value in options.items():
+            if self._isMultilineOption(value):
+                multiline[name] = value
+            else:
+                single[name] = value
+        statements = [
+            'option {} {};'.format(name, self._formatOption(value))
+            for name, value in single.items()
+        ]
+        if statements:
+            self._eval('\n'.join(statements))
+            if self._batch is None:
+                cache = self._option_cache
+                for name, value in single.items():
+                    if isinstance(value, float):
+                        cache.pop(name, None)
+                        continue
+                    if isinstance(value, bool):
+                        value = int(value)
+                    elif isinstance(value, basestring):
+                        value = self._castOption(value)
+                    cache[name] = value
+        for name, value in multiline.items():
+            self.setOption(name, value)
+
+    @staticmethod
+    def _isMultilineOption(value):
+        return isinstance(value, basestring) and '\n' in value
+
+    @staticmethod
+    def _formatOption(value):
         if isinstance(value, bool):
-            self._impl.setBoolOption(name, value)
+            return '1' if value else '0'
         elif isinstance(value, int):
-            self._impl.setIntOption(name, value)
+            return str(value)
         elif isinstance(value, float):
-            self._impl.setDblOption(name, value)
+            return repr(value)
         elif isinstance(value, basestring):
-            self._impl.setOption(name, value)
+            return "'{}'".format(value.replace("'", "''"))
         else:
             raise TypeError
 
@@ -503,18 +851,47 @@ class AMPL(object):
         Raises:
             InvalidArgumet: if the option name is not valid.
         """
+        self._flush()
+        cache = self._option_cache
+        if name in cache:
+            return cache[name]
         try:
-            value = self._impl.getOption(name).value()
+            value = self._castOption(self._impl.getOption(name).value())
         except RuntimeError:
-            return None
-        else:
-            try:
-                return int(value)
-            except ValueError:
-                try:
-                    return float(value)
-                except ValueError:
-                    return value
+            value = None
+        cache[name] = value
+        return value
+
+    def getOptions(self, names):
+        """
+        Get the current values of multiple options. Values already known from
+        previous calls to :func:`~amplpy.AMPL.getOption`,
+        :func:`~amplpy.AMPL.setOption` or :func:`~amplpy.AMPL.setOptions`
+        are returned without querying the underlying interpreter.
+
+        Args:
+            names: List of option names.
+
+        Returns:
+            Dictionary mapping each option name to its value, or to None if
+            the option does not exist.
+        """
+        return {name: self.getOption(name) for name in names}
+
+    @staticmethod
+    def _castOption(value):
+        text = value.strip()
+        digits = text[1:] if text[:1] in ('+', '-') else text
+        if digits.lower() in _SPECIAL_VALUES:
+            return float(text)
+        if digits[:1] not in _NUMERIC_START:
+            return value
+        if not digits.strip('0123456789'):
+            return int(text)
+        try:
+            return float(text)
+        except ValueError:
+            return value
 
     def read(self, fileName, **kwargs):
         """
@@ -529,12 +906,14 @@ class AMPL(object):
         Raises:
             RuntimeError: in case the file does not exist.
         """
+        self._flush()
         if self._langext is not None:
             with open(fileName, 'r') as fin:
                 newmodel = self._langext.translate(fin.read(), **kwargs)
                 with open(fileName+'.translated', 'w') as fout:
                     fout.write(newmodel)
                     fileName += '.translated'
+        self._invalidate()
         self._impl.read(fileName)
         self._errorhandler_wrapper.check()
 
@@ -552,6 +931,8 @@ class AMPL(object):
         Raises:
             RuntimeError: in case the file does not exist.
         """
+        self._flush()
+        self._invalidate()
         self._impl.readData(fileName)
         self._errorhandler_wrapper.check()
 
@@ -567,8 +948,40 @@ class AMPL(object):
         Returns:
             The value of the expression.
         """
+        self._flush()
         return Utils.castVariant(self._impl.getValue(scalarExpression))
 
+    def getValues(self, *scalarExpressions):
+        """
+        Get the values of multiple scalar expressions with a single call to
+        the underlying AMPL interpreter. Equivalent to calling
+        :func:`~amplpy.AMPL.getValue` for each expression.
+
+        Args:
+            scalarExpressions: AMPL expressions which evaluate to scalar
+            values.
+
+        Returns:
+            A list with the values of the expressions.
+
+        Raises:
+            RuntimeError: if any of the expressions does not evaluate to a
+            scalar value.
+        """
+        if len(scalarExpressions) == 0:
+            return []
+        df = self.getData(', '.join(scalarExpressions))
+        if df.getNumIndices() != 0 or df.getNumRows() != 1:
+            raise RuntimeError('The expressions must evaluate to scalars.')
+        row = list(df.getRowByIndex(0))
+        if len(row) != len(scalarExpressions):
+            raise RuntimeError(
+                'Expected {} values but got {}.'.format(
+                    len(scalarExpressions), len(row)
+                )
+            )
+        return row
+
     def setData(self, data, setName=None):
         """
         Assign the data in the dataframe to the AMPL entities with the names
@@ -583,7 +996,9 @@ class AMPL(object):
         Raises:
             AMPLException: if the data assignment procedure was not successful.
         """
+        self._flush()
         if not isinstance(data, DataFrame):
+            pd = modules.get('pandas')
             if pd is not None and isinstance(data, pd.DataFrame):
                 data = DataFrame.fromPandas(data)
         if setName is None:
@@ -603,6 +1018,7 @@ class AMPL(object):
         Args:
             tableName: Name of the table to be read.
         """
+        self._flush()
         self._impl.readTable(tableName)
 
     def writeTable(self, tableName):
@@ -617,6 +1033,7 @@ class AMPL(object):
         Args:
             tableName: Name of the table to be written.
         """
+        self._flush()
         self._impl.writeTable(tableName)
 
     def display(self, *amplExpressions):
@@ -632,6 +1049,7 @@ class AMPL(object):
         Args:
             amplExpressions: Expressions to be evaluated.
         """
+        self._flush()
         exprs = list(map(str, amplExpressions))
         self._impl.displayLst(exprs, len(exprs))
 
@@ -643,12 +1061,18 @@ class AMPL(object):
             outputhandler: The function handling the AMPL output derived from
             interpreting user commands.
         """
-        class OutputHandlerInternal(amplpython.OutputHandler):
-            def output(self, kind, msg):
-                outputhandler.output(kind, msg)
+        if type(outputhandler) is OutputHandler:
+            # The default handler derives from amplpython.OutputHandler and
+            # can be called directly, without the extra Python wrapper.
+            outputhandler_internal = outputhandler
+        else:
+            class OutputHandlerInternal(amplpython.OutputHandler):
+                def output(self, kind, msg):
+                    outputhandler.output(kind, msg)
 
+            outputhandler_internal = OutputHandlerInternal()
         self._outputhandler = outputhandler
-        self._outputhandler_internal = OutputHandlerInternal()
+        self._outputhandler_internal = outputhandler_internal
         self._impl.setOutputHandler(
             self._outputhandler_internal
         )
@@ -722,41 +1146,52 @@ class AMPL(object):
         """
         Get all the variables declared.
         """
+        self._flush()
+        cache = self._entity_cache
         variables = self._impl.getVariables()
-        return EntityMap(variables, Variable)
+        return EntityMap(variables, Variable, cache)
 
     def getConstraints(self):
         """
         Get all the constraints declared.
         """
+        self._flush()
+        cache = self._entity_cache
         constraints = self._impl.getConstraints()
-        return EntityMap(constraints, Constraint)
+        return EntityMap(constraints, Constraint, cache)
 
     def getObjectives(self):
         """
         Get all the objectives declared.
         """
+        self._flush()
+        cache = self._entity_cache
         objectives = self._impl.getObjectives()
-        return EntityMap(objectives, Objective)
+        return EntityMap(objectives, Objective, cache)
 
     def getSets(self):
         """
         Get all the sets declared.
         """
+        self._flush()
+        cache = self._entity_cache
         sets = self._impl.getSets()
-        return EntityMap(sets, Set)
+        return EntityMap(sets, Set, cache)
 
     def getParameters(self):
         """
         Get all the parameters declared.
         """
+        self._flush()
+        cache = self._entity_cache
         parameters = self._impl.getParameters()
-        return EntityMap(parameters, Parameter)
+        return EntityMap(parameters, Parameter, cache)
 
     def getCurrentObjective(self):
         """
         Get the the current objective. Returns `None` if no objective is set.
         """
+        self._flush()
         name = self._impl.getCurrentObjectiveName()
         if name == '':
             return None
@@ -874,6 +1309,7 @@ class AMPL(object):
             modfile: Path to the file (Relative to the current working
             directory or absolute).
         """
+        self._flush()
         self._impl.exportModel(modfile)
 
     def exportData(self, datfile):
@@ -884,6 +1320,7 @@ class AMPL(object):
             datfile: Path to the file (Relative to the current working
             directory or absolute).
         """
+        self._flush()
         self._impl.exportData(datfile)
 
     def exportGurobiModel(self, gurobiDriver='gurobi', verbose=False):
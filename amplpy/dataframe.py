@@ -8,14 +8,7 @@ from .base import BaseClass
 from .utils import Utils, Tuple
 from .iterators import RowIterator, ColIterator
 from . import amplpython
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
-try:
-    import numpy as np
-except ImportError:
-    np = None
+from sys import modules
 
 
 class Row(BaseClass):
@@ -209,7 +202,12 @@ class DataFrame(BaseClass):
 
             values: The values to set.
         """
-        if any(isinstance(value, basestring) for value in values):
+        np = modules.get('numpy')
+        if np is not None and isinstance(values, np.ndarray) \
+                and values.dtype.kind in 'biuf':
+            values = values.astype(float).tolist()
+            self._impl.setColumnDbl(header, values, len(values))
+        elif any(isinstance(value, basestring) for value in values):
             values = list(map(str, values))
             self._impl.setColumnStr(header, values, len(values))
         elif all(isinstance(value, Real) for value in values):
@@ -314,7 +312,7 @@ class DataFrame(BaseClass):
         """
         Return a pandas DataFrame with the DataFrame data.
         """
-        assert pd is not None
+        import pandas as pd
         nindices = self.getNumIndices()
         headers = self.getHeaders()
         columns = {
@@ -386,6 +384,7 @@ class DataFrame(BaseClass):
             df: Pandas DataFrame to load.
             index_names: index names to use.
         """
+        pd = modules.get('pandas')
         assert pd is not None
         if isinstance(df, pd.Series):
             df = pd.DataFrame(df)
@@ -404,7 +403,7 @@ class DataFrame(BaseClass):
             for i in range(len(index)):
                 index[i] = (index_names[i], index[i][1])
         columns = [
-            (str(cname), df[cname].tolist())
+            (str(cname), df[cname].values)
             for cname in df.columns.tolist()
         ]
         return cls(index=index, columns=columns)
@@ -414,11 +413,11 @@ class DataFrame(BaseClass):
         """
         Create a :class:`~amplpy.DataFrame` from a numpy array or matrix.
         """
-        assert np is not None
-        if isinstance(data, np.ndarray):
+        np = modules.get('numpy')
+        if np is not None and isinstance(data, np.ndarray):
             index = []
             if len(data.shape) == 1:
-                columns = [('value', data.tolist())]
+                columns = [('value', data)]
             elif len(data.shape) == 2:
                 columns = [
                     ('c{}'.format(i), col)
@@ -7,10 +7,7 @@ from .base import BaseClass
 from .utils import Utils, Tuple
 from .dataframe import DataFrame
 from .iterators import InstanceIterator
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+from sys import modules
 
 
 class Entity(BaseClass):
@@ -200,6 +197,7 @@ class Entity(BaseClass):
         elif isinstance(data, dict):
             self._impl.setValuesDf(DataFrame.fromDict(data)._impl)
         else:
+            pd = modules.get('pandas')
             if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
                 df = DataFrame.fromPandas(data)
                 self._impl.setValuesDf(df._impl)
@@ -25,18 +25,31 @@ class Iterator(object):
 
 
 class EntityMap(Iterator):
-    def __init__(self, obj, entityClass):
+    # The cache must be the dict that was current before obj was fetched:
+    # AMPL._invalidate replaces it, so wrappers created from an outdated map
+    # never reach the cache in use.
+    def __init__(self, obj, entityClass, cache=None):
         self.entityClass = entityClass
+        self.cache = cache if cache is not None else {}
 
         def pair(it):
-            entity = entityClass(it.__ref__())
-            return (entity.name(), entity)
+            ref = it.__ref__()
+            name = ref.name()
+            return (name, self._wrap(name, lambda: ref))
 
         Iterator.__init__(self, obj, pair)
 
+    def _wrap(self, name, getRef):
+        key = (self.entityClass, name)
+        entity = self.cache.get(key)
+        if entity is None:
+            entity = self.entityClass(getRef())
+            self.cache[key] = entity
+        return entity
+
     def __getitem__(self, key):
         assert isinstance(key, basestring)
-        return self.entityClass(self.obj.getIndex(key))
+        return self._wrap(key, lambda: self.obj.getIndex(key))
 
     def size(self):
         return int(self.obj.size())
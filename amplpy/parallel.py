@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function, absolute_import, division
+from builtins import map, range, object, zip, sorted
+from past.builtins import basestring
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .ampl import AMPL
+from .environment import Environment
+
+
+def _solve(files, options, binaryDirectory):
+    if binaryDirectory is None:
+        ampl = AMPL()
+    else:
+        ampl = AMPL(Environment(binaryDirectory))
+    try:
+        for fileName in files:
+            if fileName.endswith('.dat'):
+                ampl.readData(fileName)
+            else:
+                ampl.read(fileName)
+        if options:
+            ampl.setOptions(options)
+        ampl.solve()
+        objective = ampl.getCurrentObjective()
+        return {
+            'objective': objective.value() if objective is not None else None,
+            'solve_result': ampl.getValue('solve_result'),
+            'variables': {
+                name: variable.getValues().toDict()
+                for name, variable in ampl.getVariables()
+            },
+        }
+    finally:
+        ampl.close()
+
+
+def solve_batch_async(models, options=None, max_workers=None,
+                      binaryDirectory=None):
+    """
+    Solve multiple models in parallel, each one in a separate process with
+    its own AMPL instance.
+
+    Args:
+        models: List of models to solve. Each model is the path to a file or
+        a list of paths; files ending in ``.dat`` are read with
+        :func:`~amplpy.AMPL.readData` and the others with
+        :func:`~amplpy.AMPL.read`.
+
+        options: Dictionary with the options to set before solving (see
+        :func:`~amplpy.AMPL.setOptions`).
+
+        max_workers: Maximum number of processes (defaults to the number of
+        processors).
+
+        binaryDirectory: The directory in which look for the AMPL binary.
+
+    Returns:
+        A list of :class:`concurrent.futures.Future` objects, one per model,
+        which can be used with :func:`concurrent.futures.as_completed` or
+        :func:`concurrent.futures.wait` to process the results as they
+        complete. Each result is a dictionary with the keys ``objective``
+        (value of the current objective), ``solve_result`` and ``variables``
+        (mapping each variable name to a dictionary with its values).
+    """
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        return [
+            executor.submit(
+                _solve,
+                [model] if isinstance(model, basestring) else list(model),
+                options,
+                binaryDirectory
+            )
+            for model in models
+        ]
+    finally:
+        executor.shutdown(wait=False)
+
+
+def solve_batch(models, options=None, max_workers=None,
+                binaryDirectory=None):
+    """
+    Solve multiple models in parallel and wait for all of them to finish.
+    See :func:`~amplpy.solve_batch_async` for the description of the
+    arguments.
+
+    Returns:
+        A list with the results, in the same order as the models.
+    """
+    futures = solve_batch_async(
+        models, options, max_workers, binaryDirectory
+    )
+    return [future.result() for future in futures]
@@ -7,10 +7,7 @@ from numbers import Real
 from .entity import Entity
 from .utils import Utils, Tuple
 from .dataframe import DataFrame
-try:
-    import numpy as np
-except ImportError:
-    np = None
+from sys import modules
 
 
 class Parameter(Entity):
@@ -134,6 +131,7 @@ class Parameter(Entity):
             else:
                 raise TypeError
         else:
+            np = modules.get('numpy')
             if np is not None and isinstance(values, np.ndarray):
                 self.setValues(DataFrame.fromNumpy(values).toList())
                 return
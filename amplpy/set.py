@@ -8,10 +8,7 @@ from .entity import Entity
 from .utils import Utils, Tuple
 from .dataframe import DataFrame
 from .iterators import MemberRangeIterator
-try:
-    import numpy as np
-except ImportError:
-    np = None
+from sys import modules
 
 
 class Set(Entity):
@@ -115,6 +112,7 @@ class Set(Entity):
             else:
                 self._impl.setValues(Utils.toTupleArray(values), len(values))
         else:
+            np = modules.get('numpy')
             if np is not None and isinstance(values, np.ndarray):
                 self.setValues(DataFrame.fromNumpy(values).toList())
                 return
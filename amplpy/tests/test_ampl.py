@@ -45,12 +45,22 @@ class TestAMPL(TestBase.TestBase):
         self.assertTrue(isinstance(ampl.getVariable('_v'), Variable))
         self.assertTrue(isinstance(ampl.getConstraint('_c'), Constraint))
         self.assertTrue(isinstance(ampl.getObjective('_o'), Objective))
+        self.assertTrue(ampl.getVariable('_v') is ampl.getVariable('_v'))
+        variable = ampl.getVariable('_v')
+        ampl.eval('param _q;')
+        self.assertFalse(ampl.getVariable('_v') is variable)
         print(list(ampl.getSets()))
         # self.assertEqual(len(ampl.getSets()), 1) # FIXME: 2 != 1
         self.assertEqual(len(ampl.getParameters()), 1)
         self.assertEqual(len(ampl.getVariables()), 1)
         self.assertEqual(len(ampl.getConstraints()), 1)
         self.assertEqual(len(ampl.getObjectives()), 1)
+        self.assertTrue(
+            dict(ampl.getVariables())['_v'] is ampl.getVariable('_v')
+        )
+        self.assertTrue(
+            ampl.getConstraints()['_c'] is ampl.getConstraint('_c')
+        )
         ampl.reset()
         with self.assertRaises(ValueError):
             ampl.eval('X')
@@ -81,6 +91,92 @@ class TestAMPL(TestBase.TestBase):
         self.assertEqual(ampl.getOption('b'), 123)
         self.assertEqual(ampl.getOption('c'), 1.23)
         self.assertEqual(ampl.getOption('d'), True)
+        ampl.setOption('d', False)
+        self.assertEqual(ampl.getOption('d'), 0)
+        ampl.setOption('c', 2.5)
+        self.assertEqual(ampl.getOption('c'), 2.5)
+        ampl.setOption('c', 2.0)
+        self.assertEqual(ampl.getOption('c'), 2)
+        self.assertIsInstance(ampl.getOption('c'), int)
+        ampl.eval('option b 7;')
+        self.assertEqual(ampl.getOption('b'), 7)
+        ampl.reset()
+        self.assertEqual(ampl.getOption('b'), 7)
+
+    def testCastOption(self):
+        castOption = amplpy.AMPL._castOption
+        self.assertEqual(castOption('123'), 123)
+        self.assertEqual(castOption(' -7 '), -7)
+        self.assertEqual(castOption('1.5'), 1.5)
+        self.assertEqual(castOption('-1e-06'), -1e-06)
+        self.assertEqual(castOption('Infinity'), float('inf'))
+        self.assertEqual(castOption('cbc'), 'cbc')
+        self.assertEqual(castOption('nl'), 'nl')
+        self.assertEqual(castOption('ipopt'), 'ipopt')
+        self.assertEqual(castOption('ilogcp'), 'ilogcp')
+        self.assertEqual(castOption('-Infinity'), -float('inf'))
+        self.assertEqual(castOption('+'), '+')
+        self.assertEqual(castOption('1 2'), '1 2')
+        self.assertEqual(castOption(''), '')
+
+    def testSetOptions(self):
+        ampl = self.ampl
+        ampl.setOptions({'a': 's', 'b': 123, 'c': 1.23, 'd': True})
+        with self.assertRaises(TypeError):
+            ampl.setOptions({'e': None})
+        self.assertEqual(ampl.getOption('a'), 's')
+        self.assertEqual(ampl.getOption('b'), 123)
+        self.assertEqual(ampl.getOption('c'), 1.23)
+        self.assertEqual(ampl.getOption('d'), True)
+        self.assertEqual(
+            ampl.getOptions(['a', 'b', 'x_y_z']),
+            {'a': 's', 'b': 123, 'x_y_z': None}
+        )
+        ampl.setOptions({'c': 2.0})
+        self.assertIsInstance(ampl.getOption('c'), int)
+        ampl.setOptions({'m': 'x=1\ny=2', 'n': 'z'})
+        self.assertEqual(ampl.getOption('m'), 'x=1\ny=2')
+        self.assertEqual(ampl.getOption('n'), 'z')
+
+    def testEvalMany(self):
+        ampl = self.ampl
+        ampl.evalMany(['param a := 1', 'param b := 2;', 'param c := a + b'])
+        self.assertEqual(ampl.getValue('c'), 3)
+        ampl.evalMany([
+            'set S = {1, 2}',
+            'param d := 4  # trailing comment',
+            'param n := card(S) + d',
+        ])
+        self.assertEqual(ampl.getValue('n'), 6)
+
+    def testBatch(self):
+        ampl = self.ampl
+        with ampl.batch():
+            ampl.eval('param p := 5;')
+            ampl.setOption('a', "it's")
+            ampl.setOption('b', 123)
+        self.assertEqual(ampl.getValue('p'), 5)
+        self.assertEqual(ampl.getOption('a'), "it's")
+        self.assertEqual(ampl.getOption('b'), 123)
+        with self.assertRaises(RuntimeError):
+            with ampl.batch():
+                ampl.eval('param q := 1;')
+                raise RuntimeError
+        with self.assertRaises(TypeError):
+            ampl.getParameter('q')
+        data = self.str2file('data.dat', '''
+            param r := 2;
+        ''')
+        with ampl.batch():
+            ampl.eval('param r;')
+            ampl.setOption('c', 7)
+            self.assertEqual(ampl.getOption('c'), 7)
+            ampl.readData(data)
+            ampl.eval('param t := r * 3;')
+            self.assertEqual(ampl.getValue('t'), 6)
+        with ampl.batch():
+            ampl.setOption('m', 'x=1\ny=2')
+        self.assertEqual(ampl.getOption('m'), 'x=1\ny=2')
 
     def testHandlers(self):
         from time import sleep
@@ -281,6 +377,70 @@ class TestAMPL(TestBase.TestBase):
             mutex2.release()
             raise
 
+    def testAsyncFuture(self):
+        ampl = self.ampl
+        future = ampl.evalAsync('param z := 3;')
+        self.assertEqual(future.result(), None)
+        self.assertEqual(ampl.getValue('z'), 3)
+        ampl.setOption('b', 1)
+        future = ampl.evalAsync('option b 9;')
+        ampl.getOption('b')
+        future.result()
+        self.assertEqual(ampl.getOption('b'), 9)
+        future = ampl.evalAsync('X X;')
+        with self.assertRaises(amplpy.AMPLException):
+            future.result()
+
+    def testGetValues(self):
+        ampl = self.ampl
+        ampl.eval('param p := 2; param s symbolic := "a";')
+        self.assertEqual(ampl.getValues('p', 's', 'p * 3'), [2, 'a', 6])
+        self.assertEqual(ampl.getValues(), [])
+        self.assertEqual(ampl.getValues('max(p, 5)', 's'), [5, 'a'])
+        ampl.eval('param v{i in 1..3} := i;')
+        with self.assertRaises(RuntimeError):
+            ampl.getValues('v')
+
+    def testGetVariableSnapshot(self):
+        ampl = self.ampl
+        ampl.eval('var x{i in 1..3} := i; var y := 5; minimize o: y;')
+        names, values, reducedCosts = ampl.getVariableSnapshot()
+        self.assertEqual(names, ['x[1]', 'x[2]', 'x[3]', 'y'])
+        self.assertEqual(values, [1, 2, 3, 5])
+        self.assertEqual(len(reducedCosts), 4)
+
+    def testSolveBatch(self):
+        ampl = self.ampl
+        ampl.eval('var t >= 0; minimize o0: t;')
+        try:
+            ampl.solve()
+        except amplpy.AMPLException:
+            self.skipTest('no solver available')
+        if ampl.getValue('solve_result') != 'solved':
+            self.skipTest('no solver available')
+        model = self.str2file('model.mod', '''
+            param c;
+            var x >= 0, <= 10;
+            maximize o: c * x;
+        ''')
+        data1 = self.str2file('data1.dat', 'param c := 1;')
+        data2 = self.str2file('data2.dat', 'param c := 2;')
+        results = amplpy.solve_batch(
+            [[model, data1], (model, data2)], max_workers=2
+        )
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(
+                sorted(result.keys()),
+                ['objective', 'solve_result', 'variables']
+            )
+            self.assertEqual(result['solve_result'], 'solved')
+        self.assertAlmostEqual(results[0]['objective'], 10)
+        self.assertAlmostEqual(results[1]['objective'], 20)
+        self.assertAlmostEqual(results[0]['variables']['x'][None], 10)
+        futures = amplpy.solve_batch_async([[model, data2]])
+        self.assertAlmostEqual(futures[0].result()['objective'], 20)
+
     def testGetOutput(self):
         ampl = self.ampl
         self.assertEqual(ampl.getOutput('display 5;'), '5 = 5\n\n')
@@ -227,6 +227,16 @@ class TestDataFrame(TestBase.TestBase):
             DataFrame.fromNumpy(mat[:, 1]).toList(),
             [2, 4, 6]
         )
+        ampl.eval('param q{i in 1..3} := 2 * i;')
+        arrays = ampl.getDataArray('q')
+        self.assertEqual(list(arrays['q']), [2, 4, 6])
+        self.assertEqual(arrays['q'].dtype, np.float64)
+        ampl.eval('set M := {1, "a"}; param m{M} := 1;')
+        arrays = ampl.getDataArray('m')
+        self.assertEqual(arrays['m'].dtype, np.float64)
+        index = [header for header in arrays if header != 'm'][0]
+        self.assertEqual(arrays[index].dtype, object)
+        self.assertEqual(list(arrays[index]), [1, 'a'])
 
     def testDict(self):
         dic = {'aa': 'bb', 'c': 'a'}
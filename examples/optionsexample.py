@@ -25,21 +25,19 @@ def main(argc, argv):
         print("AMPL presolve is", presolve)
 
         # Set the value to false (maps to 0)
-        ampl.setOption('presolve', False)
+        ampl.setOptions({'presolve': False})
 
-        # Get the value of the option presolve and print
-        presolve = ampl.getOption('presolve')
-        print("AMPL presolve is now", presolve)
+        # Get the values of multiple options at once
+        values = ampl.getOptions(['presolve', 'solver', 's_o_l_v_e_r'])
+        print("AMPL presolve is now", values['presolve'])
 
         # Check whether an option with a specified name
         # exists
-        value = ampl.getOption('solver')
-        if value is not None:
-            print("Option solver exists and has value:", value)
+        if values['solver'] is not None:
+            print("Option solver exists and has value:", values['solver'])
 
         # Check again, this time failing
-        value = ampl.getOption('s_o_l_v_e_r')
-        if value is None:
+        if values['s_o_l_v_e_r'] is None:
             print("Option s_o_l_v_e_r does not exist!")
     except Exception as e:
         print(e)
@@ -161,5 +161,8 @@ setup(
         ],
     )],
     package_data={'': package_content()},
-    install_requires=['future >= 0.15.0']
+    install_requires=[
+        'future >= 0.15.0',
+        'futures; python_version < "3"',
+    ]
 )